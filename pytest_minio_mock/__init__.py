@@ -1,3 +1,7 @@
-from pytest_minio_mock.plugin import minio_mock, minio_mock_servers
+from pytest_minio_mock.plugin import (
+    minio_mock,
+    minio_mock_servers,
+    minio_mock_servers_session,
+)
 
-__all__ = ["minio_mock", "minio_mock_servers"]
+__all__ = ["minio_mock", "minio_mock_servers", "minio_mock_servers_session"]
@@ -1,6 +1,15 @@
 from minio.error import S3Error
 from urllib3.response import HTTPResponse
 
+# The mocked errors never read their response, so they can all share these
+_EMPTY_RESPONSE = HTTPResponse("mocked_response")
+_DELETE_MARKER_RESPONSE = HTTPResponse(
+    "mocked_response", headers={"x-amz-delete-marker": "true"}
+)
+# Also reported by bulk deletes, which do not build an error for it
+_NO_SUCH_KEY_CODE = "NoSuchKey"
+_NO_SUCH_KEY_MESSAGE = "Object does not exist"
+
 
 def no_such_bucket(bucket_name):
     return S3Error(
@@ -8,7 +17,7 @@ def no_such_bucket(bucket_name):
         resource=f"/{bucket_name}",
         request_id=None,
         host_id=None,
-        response=HTTPResponse("mocked_response"),
+        response=_EMPTY_RESPONSE,
         code="NoSuchBucket",
         bucket_name=bucket_name,
         object_name=None,
@@ -17,15 +26,12 @@ def no_such_bucket(bucket_name):
 
 def no_such_key(bucket_name, object_name, is_deleted=False):
     return S3Error(
-        message="Object does not exist",
+        message=_NO_SUCH_KEY_MESSAGE,
         resource=f"/{bucket_name}/{object_name}",
         request_id=None,
         host_id=None,
-        response=HTTPResponse(
-            "mocked_response",
-            headers={} if not is_deleted else {"x-amz-delete-marker": "true"},
-        ),
-        code="NoSuchKey",
+        response=_DELETE_MARKER_RESPONSE if is_deleted else _EMPTY_RESPONSE,
+        code=_NO_SUCH_KEY_CODE,
         bucket_name=bucket_name,
         object_name=object_name,
     )
@@ -37,7 +43,7 @@ def invalid_version(bucket_name, object_name):
         resource=f"/{bucket_name}/{object_name}",
         request_id=None,
         host_id=None,
-        response=HTTPResponse("mocked_response"),
+        response=_EMPTY_RESPONSE,
         code="InvalidArgument",
         bucket_name=bucket_name,
         object_name=object_name,
@@ -50,7 +56,7 @@ def no_such_version(bucket_name, object_name):
         resource=f"/{bucket_name}/{object_name}",
         request_id=None,
         host_id=None,
-        response=HTTPResponse("mocked_response"),
+        response=_EMPTY_RESPONSE,
         code="NoSuchVersion",
         bucket_name=bucket_name,
         object_name=object_name,
@@ -63,7 +69,7 @@ def method_not_allowed(bucket_name, object_name):
         resource=f"/{bucket_name}/{object_name}",
         request_id=None,
         host_id=None,
-        response=HTTPResponse("mocked_response"),
+        response=_EMPTY_RESPONSE,
         code="MethodNotAllowed",
         bucket_name=bucket_name,
         object_name=object_name,
@@ -1,15 +1,15 @@
-import copy
 import datetime
+import functools
 import io
+import ipaddress
 import itertools
-import sys
+import re
 from collections.abc import Generator, Iterable, Iterator
 from pathlib import Path
 from typing import BinaryIO, Literal, Union
 from uuid import UUID, uuid4
 
 import pytest
-import validators
 from minio import Minio, S3Error
 from minio.commonconfig import ENABLED, ComposeSource, CopySource, Tags
 from minio.datatypes import Object
@@ -23,11 +23,14 @@ from minio.helpers import ObjectWriteResult, ProgressType
 from minio.retention import Retention
 from minio.sse import Sse, SseCustomerKey
 from minio.versioningconfig import OFF, SUSPENDED, VersioningConfig
+from sortedcontainers import SortedDict
 from urllib3._collections import HTTPHeaderDict
 from urllib3.connection import HTTPConnection
 from urllib3.response import HTTPResponse
 
 from .exceptions import (
+    _NO_SUCH_KEY_CODE,
+    _NO_SUCH_KEY_MESSAGE,
     invalid_version,
     method_not_allowed,
     no_such_bucket,
@@ -36,31 +39,130 @@ from .exceptions import (
 )
 from .utils import _list_objects_checks
 
+# A DNS label can neither be empty nor start or end with a hyphen
+_LABEL = r"[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?"
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+# [http(s)://]host[:port], host being a name (whose last label is not all
+# digits, so that bad IPv4 are not taken for names), an IPv4 or a bracketed
+# IPv6 (checked by ipaddress). Like with the real client, paths are not
+# allowed. To be used with fullmatch, "$" would let a trailing newline in.
+_ENDPOINT_RE = re.compile(
+    r"(?:https?://)?"
+    rf"(?:(?:{_LABEL}\.)*(?=[A-Za-z0-9-]*[A-Za-z]){_LABEL}"
+    rf"|(?:{_OCTET}\.){{3}}{_OCTET}"
+    r"|\[(?P<ipv6>[0-9A-Fa-f:.]+)\])"
+    r"(?::(?P<port>\d{1,5}))?"
+)
+_MAX_PORT = 65535
+# minio reports is_latest as a lower-case string
+_TRUE = "true"
+_FALSE = "false"
+# Default for lookups where None could be a legitimate value
+_SENTINEL = object()
+# Responses need a connection but never open it, one can serve them all
+_CONNECTION = HTTPConnection("localhost")
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_endpoint(endpoint: str) -> bool:
+    match = _ENDPOINT_RE.fullmatch(endpoint)
+    if match is None:
+        return False
+    ipv6 = match.group("ipv6")
+    if ipv6 is not None:
+        try:
+            ipaddress.IPv6Address(ipv6)
+        except ValueError:
+            return False
+    port = match.group("port")
+    return port is None or int(port) <= _MAX_PORT
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version_id(version_id: str) -> UUID:
+    # The same version ids tend to be passed around again and again (listing,
+    # then getting or removing them), parse each of them once
+    return UUID(version_id)
+
+
+def _next_slashes_key(
+    objects: SortedDict, dir_name: str, after: str
+) -> Union[str, None]:
+    # A non-recursive listing strips the slashes around a key, so among the
+    # keys under dir_name, dir_name followed by nothing but slashes (like
+    # "a//") is listed as a file. Find the first of them after the given key.
+    key = dir_name + "/"
+    while True:
+        following = next(objects.irange(minimum=key), None)
+        if following is None or not following.startswith(key):
+            # No longer run of slashes either
+            return None
+        if following == key and key > after:
+            return key
+        key += "/"
+
 
 class MockMinioObjectVersion:
+    # One instance per stored version, there can be a lot of them
+    __slots__ = (
+        "_payload",
+        "_size",
+        "_data",
+        "_version_id",
+        "_version_id_str",
+        "_is_delete_marker",
+        "_metadata",
+        "_last_modified",
+    )
+
     def __init__(
         self,
         data: Union[BinaryIO, bytes],
         version_id: Union[UUID, Literal["null"]],
         is_delete_marker: bool,
         metadata: Union[dict, None] = None,
+        length: Union[int, None] = None,
     ):
-        if isinstance(data, bytes):
-            self._size = len(data)
-            data = io.BytesIO(data)
+        # Like the real client, keep at most length bytes (everything when
+        # the length is unknown), read from the current position of streams
+        limit = None if length is None or length < 0 else length
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload = data if limit is None else data[:limit]
+            # Keep the payload as immutable bytes (only mutable buffers are
+            # copied), the BytesIO is only built if someone reads it back
+            if not isinstance(payload, bytes):
+                payload = bytes(payload)
+        elif isinstance(data, io.BytesIO) and data.tell() == 0:
+            # Shares the buffer of the BytesIO, it is only copied if the
+            # caller writes to it afterwards
+            payload = data.getvalue()
+            if limit is not None:
+                payload = payload[:limit]
+            # Leave the stream where reading it would have
+            data.seek(len(payload))
         else:
-            self._size = len(data.read())
-            data.seek(0)
-        self._data = data
+            # The caller may close or reuse the stream once put returns,
+            # so read it now, like the real client does
+            payload = data.read() if limit is None else data.read(limit)
+        self._payload = payload
+        self._size = len(payload)
+        self._data = None
         self._version_id = version_id
+        self._version_id_str = str(version_id) if version_id != "null" else None
         self._is_delete_marker = is_delete_marker
         self._metadata = metadata if metadata is not None else {}
         self._last_modified = datetime.datetime.now()
 
     @property
     def data(self) -> BinaryIO:
+        if self._data is None:
+            self._data = io.BytesIO(self._payload)
         return self._data
 
+    @property
+    def payload(self) -> bytes:
+        return self._payload
+
     @property
     def metadata(self) -> dict:
         return self._metadata
@@ -71,7 +173,7 @@ class MockMinioObjectVersion:
 
     @property
     def version_id(self) -> Union[str, None]:
-        return str(self._version_id) if self._version_id != "null" else None
+        return self._version_id_str
 
     @property
     def last_modified(self) -> datetime.datetime:
@@ -87,6 +189,13 @@ class MockMinioObjectVersion:
 
 
 class MockMinioObject:
+    __slots__ = (
+        "_bucket_name",
+        "_object_name",
+        "_versions",
+        "latest_version_id",
+    )
+
     def __init__(
         self,
         bucket_name: str,
@@ -144,17 +253,25 @@ class MockMinioObject:
 
     def put_object_version(
         self,
-        data: Union[BinaryIO, bytes] = io.BytesIO(b""),
+        data: Union[BinaryIO, bytes, None] = None,
         version_id: Union[UUID, Literal["null"]] = "null",
         is_delete_marker=False,
         metadata: Union[dict, None] = None,
+        length: Union[int, None] = None,
     ):
+        if data is None:
+            # Delete markers have no content
+            data = b""
+        # Re-inserting an overwritten version (only the 'null' one can be)
+        # keeps _versions in creation order, oldest first
+        self._versions.pop(version_id, None)
         self.latest_version_id = version_id
         self._versions[self.latest_version_id] = MockMinioObjectVersion(
             data=data,
             version_id=version_id,
             is_delete_marker=is_delete_marker,
             metadata=metadata,
+            length=length,
         )
         return self._versions[self.latest_version_id]
 
@@ -173,9 +290,11 @@ class MockMinioObject:
         legal_hold: bool,
         versioning: VersioningConfig = VersioningConfig(),
     ) -> ObjectWriteResult:
+        # status is a property, read it once
+        status = versioning.status
         # If versioning is OFF, there can only be one version of an object
         # (store a read version_id non-the-less, but the version_id is 'null')
-        if versioning.status == OFF:
+        if status == OFF:
             self._versions = {}
 
         # According to
@@ -183,8 +302,9 @@ class MockMinioObject:
         # objects created when versioning is suspended have a 'null' version ID
         obj_version = self.put_object_version(
             data=data,
-            version_id="null" if versioning.status != ENABLED else uuid4(),
+            version_id="null" if status != ENABLED else uuid4(),
             metadata=metadata,
+            length=length,
         )
         return ObjectWriteResult(
             self.bucket_name,
@@ -199,14 +319,18 @@ class MockMinioObject:
     def get_object(
         self, version_id: Union[str, None], versioning: VersioningConfig
     ) -> MockMinioObjectVersion:
-        if versioning.status == OFF:
+        versioning_off = versioning.status == OFF
+        if versioning_off:
             # Versioning is OFF if and only if the bucket has never been
             # versioned so only the 'null' version matters
+            the_object = self._versions.get("null")
+            if the_object is not None and not the_object.is_delete_marker:
+                return the_object
             version_id = None
 
         version_id = self._check_version_id(version_id)
         if not version_id:
-            if versioning.status == OFF:
+            if versioning_off:
                 the_object = self._check_object_version("null")
             else:
                 the_object = self.get_latest()
@@ -223,48 +347,50 @@ class MockMinioObject:
     def list_versions(
         self,
     ) -> list[tuple[Union[UUID, Literal["null"]], MockMinioObjectVersion]]:
-        return sorted(
-            self.versions.items(),
-            key=lambda i: (
-                i[1].is_delete_marker,
-                -i[1].last_modified.timestamp(),
-            ),
-        )
+        # _versions is in creation order, so no sorting is needed: newest
+        # first, delete markers last
+        newest_first = list(reversed(self._versions.items()))
+        return [i for i in newest_first if not i[1].is_delete_marker] + [
+            i for i in newest_first if i[1].is_delete_marker
+        ]
 
     def remove_object(
-        self, version_id: Union[str, None], versioning: VersioningConfig
-    ):
-        def _delete_version(v_):
-            if version_id not in self.versions:
+        self, version_id: Union[str, UUID, None], versioning: VersioningConfig
+    ) -> bool:
+        # Returns whether the last version is gone, in which case the bucket
+        # should drop the object
+        def _delete_version(v_) -> bool:
+            if self._versions.pop(v_, _SENTINEL) is _SENTINEL:
                 # version_id does not exist, nothing to do
-                return
-            del self.versions[v_]
-            if self._versions and v_ == self.latest_version_id:
-                self.latest_version_id = list(self.versions.values())[  # noqa: SLF001
-                    -1
-                ]._version_id
+                return False
+            if not self._versions:
+                return True
+            if v_ == self.latest_version_id:
+                # The versions are keyed by their version_id
+                self.latest_version_id = next(reversed(self._versions))
+            return False
 
         version_id = self._check_version_id(version_id)
-        if versioning.status == ENABLED:
+        status = versioning.status
+        if status == ENABLED:
             if version_id:
-                _delete_version(version_id)
-                return
+                return _delete_version(version_id)
             # version_id is not specified, remove latest
             if self.get_latest().is_delete_marker:
                 # nothing to do
-                return
+                return False
             version_id = uuid4()
 
             self.put_object_version(
                 version_id=version_id, is_delete_marker=True
             )
-            return
+            return False
 
-        if versioning.status == SUSPENDED:
+        if status == SUSPENDED:
             if version_id:
-                _delete_version(version_id)
-                return
+                return _delete_version(version_id)
             self.get_latest().is_delete_marker = True
+        return False
 
     def stat_object(
         self,
@@ -282,14 +408,16 @@ class MockMinioObject:
         )
 
     def _check_version_id(
-        self, version_id: Union[str, None] = None
+        self, version_id: Union[str, UUID, None] = None
     ) -> Union[UUID, Literal["null"], None]:
         if not version_id:
             return None
+        if isinstance(version_id, UUID):
+            return version_id
         if version_id == "null":
             return "null"
         try:
-            return UUID(version_id)
+            return _parse_version_id(version_id)
         except ValueError as error:
             raise invalid_version(self.bucket_name, self.object_name) from error
 
@@ -297,7 +425,7 @@ class MockMinioObject:
         self, version_id: Union[UUID, Literal["null"]]
     ) -> MockMinioObjectVersion:
         try:
-            return self.versions[version_id]
+            return self._versions[version_id]
         except KeyError as error:
             raise no_such_version(self.bucket_name, self.object_name) from error
 
@@ -312,7 +440,8 @@ class MockMinioBucket:
     ):
         self._bucket_name = bucket_name
         self._versioning = versioning
-        self._objects = {}
+        # Kept sorted so that listings only visit the keys they return
+        self._objects = SortedDict()
         self._location = location
         self._object_lock = object_lock
 
@@ -321,7 +450,7 @@ class MockMinioBucket:
         return self._bucket_name
 
     @property
-    def objects(self) -> dict[str, MockMinioObject]:
+    def objects(self) -> SortedDict[str, MockMinioObject]:
         return self._objects
 
     @property
@@ -347,8 +476,9 @@ class MockMinioBucket:
         retention: Retention,
         legal_hold: bool,
     ) -> ObjectWriteResult:
-        if object_name not in self.objects:
-            self.objects[object_name] = MockMinioObject(
+        obj = self._objects.get(object_name)
+        if obj is None:
+            obj = self._objects[object_name] = MockMinioObject(
                 self.bucket_name,
                 object_name,
                 data=data,
@@ -364,7 +494,7 @@ class MockMinioBucket:
                 legal_hold=legal_hold,
                 versioning=self.versioning,
             )
-            obj_version = self.objects[object_name].get_latest()
+            obj_version = obj.get_latest()
             return ObjectWriteResult(
                 self.bucket_name,
                 object_name,
@@ -374,7 +504,7 @@ class MockMinioBucket:
                 obj_version.last_modified,
                 None,
             )
-        return self.objects[object_name].put_object(
+        return obj.put_object(
             data=data,
             length=length,
             content_type=content_type,
@@ -392,19 +522,26 @@ class MockMinioBucket:
     def remove_object(
         self, object_name: str, version_id: Union[str, None] = None
     ):
-        if object_name not in self.objects:
+        obj = self._objects.get(object_name)
+        if obj is None:
             # object does not exist, so nothing to do
             return
+        self._remove_object(obj, version_id)
+
+    def _remove_object(
+        self,
+        obj: MockMinioObject,
+        version_id: Union[str, UUID, None] = None,
+    ):
         if self.versioning.status == OFF:
             # Versioning if off if and only if it has never been enabled, so
             # the object is deleted completely
-            del self.objects[object_name]
+            del self.objects[obj.object_name]
             return
-        self.objects[object_name].remove_object(version_id, self.versioning)
-        if not self.objects[object_name]._versions:  # noqa: SLF001
+        if obj.remove_object(version_id, self.versioning):
             # If the last version was deleted, remove the object from the
             # bucket entierly
-            del self.objects[object_name]
+            del self.objects[obj.object_name]
 
     def get_object(
         self, object_name: str, version_id: Union[str, None] = None
@@ -430,54 +567,85 @@ class MockMinioBucket:
         start_after, recursive = _list_objects_checks(
             use_api_v1, start_after, delimiter
         )
+        # minio accepts prefix=None for "everything"
+        prefix = prefix or ""
         seen_prefixes = set()
+        objects = self._objects
+        bucket_name = self.bucket_name
+        prefix_len = len(prefix)
 
-        for object_name, obj in self.objects.items():
-            if object_name.startswith(prefix) and (
-                start_after == "" or object_name > start_after
-            ):
-                # Handle non-recursive listing by identifying and adding unique
-                # directory names
+        if start_after and start_after >= prefix:
+            object_names = objects.irange(
+                minimum=start_after, inclusive=(False, True)
+            )
+        else:
+            object_names = objects.irange(minimum=prefix)
+
+        while object_names is not None:
+            # Set again only to restart the walk after a pseudo-directory
+            keys, object_names = object_names, None
+            for object_name in keys:
+                if not object_name.startswith(prefix):
+                    # Keys are sorted: once out of the prefix range, nothing
+                    # further down can match it
+                    return
+                # Handle non-recursive listing by identifying and adding
+                # unique directory names
                 if not recursive:
-                    sub_path = object_name[len(prefix) :].strip("/")
+                    sub_path = object_name[prefix_len:].strip("/")
                     dir_end_idx = sub_path.find("/")
                     if dir_end_idx != -1:
                         dir_name = prefix + sub_path[: dir_end_idx + 1]
                         if dir_name not in seen_prefixes:
                             seen_prefixes.add(dir_name)
-                            yield Object(
-                                bucket_name=self.bucket_name,
-                                object_name=dir_name,
+                            yield Object(bucket_name, dir_name)
+                        if object_name.startswith(dir_name):
+                            # The keys under dir_name are contiguous and all
+                            # sort before dir_name with its "/" bumped to
+                            # "0": jump straight past them, or to the next
+                            # file in there (see _next_slashes_key)
+                            object_names = objects.irange(
+                                minimum=_next_slashes_key(
+                                    objects, dir_name, object_name
+                                )
+                                or dir_name[:-1] + "0"
                             )
+                            break
                         # Skip further processing to prevent
                         # adding the full object path
                         continue
                 # Directly add the object for recursive listing
                 # or if it's a file in the current directory
+                obj = objects[object_name]
                 if include_version:
                     # Minio API always sort versions by time,
                     # it also includes delete markers at the end newest first
+                    latest = obj.latest_version_id
                     for version, obj_version in obj.list_versions():
+                        # Positional arguments (bucket_name, object_name,
+                        # last_modified, etag, size, metadata, version_id,
+                        # is_latest) are about twice as fast as keywords
                         yield Object(
-                            bucket_name=self.bucket_name,
-                            object_name=object_name,
-                            last_modified=obj_version.last_modified,
-                            version_id=obj_version.version_id,
-                            is_latest=str(
-                                version == obj.latest_version_id
-                            ).lower(),
+                            bucket_name,
+                            object_name,
+                            obj_version.last_modified,
+                            None,
+                            None,
+                            obj_version.metadata,
+                            obj_version.version_id,
+                            _TRUE if version == latest else _FALSE,
                             is_delete_marker=obj_version.is_delete_marker,
-                            metadata=obj_version.metadata,
                         )
                 elif not (obj_version := obj.get_latest()).is_delete_marker:
                     yield Object(
-                        bucket_name=self.bucket_name,
-                        object_name=object_name,
-                        last_modified=obj_version.last_modified,
-                        version_id=obj_version.version_id,
-                        is_latest="true",
-                        is_delete_marker=obj_version.is_delete_marker,
-                        metadata=obj_version.metadata,
+                        bucket_name,
+                        object_name,
+                        obj_version.last_modified,
+                        None,
+                        None,
+                        obj_version.metadata,
+                        obj_version.version_id,
+                        _TRUE,
                     )
 
     def _check_object(self, object_name) -> MockMinioObject:
@@ -537,7 +705,7 @@ class MockMinioClient:
     ):
         if not endpoint:
             raise ValueError("base_url is empty")
-        if not validators.hostname(endpoint) and not validators.url(endpoint):
+        if not _is_valid_endpoint(endpoint):
             raise ValueError(f"base_url {endpoint} is not valid")
         self._base_url = endpoint
         self._access_key = access_key
@@ -584,24 +752,17 @@ class MockMinioClient:
         version_id: Union[str, None] = None,
         extra_query_params: Union[dict, None] = None,
     ):
-        data = (
+        payload = (
             self.__check_bucket(bucket_name)
             .get_object(object_name, version_id)
-            .data
+            .payload
+        )
+        # A BytesIO over immutable bytes shares their buffer: each response
+        # gets its own read position without copying the content
+        body = io.BytesIO(payload)
+        return HTTPResponse(
+            body=body, preload_content=False, connection=_CONNECTION
         )
-
-        # Create a buffer containing the data
-        if isinstance(data, io.BytesIO):
-            body = copy.deepcopy(data)
-        elif isinstance(data, bytes):
-            body = data
-        elif isinstance(data, str):
-            body = io.BytesIO(data.encode("utf-8"))
-        else:
-            body = data
-
-        conn = HTTPConnection("localhost")
-        return HTTPResponse(body=body, preload_content=False, connection=conn)
 
     def fput_object(
         self,
@@ -618,23 +779,23 @@ class MockMinioClient:
         retention: Union[Retention, None] = None,
         legal_hold: bool = False,
     ) -> ObjectWriteResult:
-        with Path(file_path).open("rb") as file_data:
-            data = file_data.read()
-        return self.put_object(
-            bucket_name,
-            object_name,
-            io.BytesIO(data),
-            length=len(data),
-            content_type=content_type,
-            metadata=metadata,
-            sse=sse,
-            progress=progress,
-            part_size=part_size,
-            num_parallel_uploads=num_parallel_uploads,
-            tags=tags,
-            retention=retention,
-            legal_hold=legal_hold,
-        )
+        path = Path(file_path)
+        with path.open("rb") as file_data:
+            return self.put_object(
+                bucket_name,
+                object_name,
+                file_data,
+                length=path.stat().st_size,
+                content_type=content_type,
+                metadata=metadata,
+                sse=sse,
+                progress=progress,
+                part_size=part_size,
+                num_parallel_uploads=num_parallel_uploads,
+                tags=tags,
+                retention=retention,
+                legal_hold=legal_hold,
+            )
 
     def put_object(
         self,
@@ -728,11 +889,7 @@ class MockMinioClient:
         return list(self.buckets)
 
     def bucket_exists(self, bucket_name: str) -> bool:
-        try:
-            self.buckets[bucket_name]
-        except KeyError:
-            return False
-        return True
+        return bucket_name in self.buckets
 
     def make_bucket(
         self,
@@ -836,27 +993,21 @@ class MockMinioClient:
     ) -> ObjectWriteResult:
         if not isinstance(sources, (list, tuple)) or not sources:
             raise ValueError("sources must be non-empty list or tuple type")
-        data = b""
+        chunks = []
         if metadata is None:
             metadata = {}
         metadata_ = {}
         for source in sources:
-            data += self.get_object(
-                source.bucket_name,
-                source.object_name,
-                version_id=source.version_id,
-            ).data
-            metadata_.update(
-                self.buckets[source.bucket_name]
-                .objects[source.object_name]
-                .get_object(
-                    source.version_id,
-                    self.get_bucket_versioning(source.bucket_name),
-                )
-                .metadata
-                | {}
+            # One lookup gives both the content and the metadata
+            version = self.__check_bucket(source.bucket_name).get_object(
+                source.object_name, source.version_id
             )
+            chunks.append(version.payload)
+            metadata_.update(version.metadata)
         metadata_.update(metadata)
+        # Joined once: concatenating in the loop copies the growing buffer
+        # for every source
+        data = b"".join(chunks)
         return self.put_object(
             bucket_name, object_name, data, length=len(data), metadata=metadata_
         )
@@ -876,22 +1027,14 @@ class MockMinioClient:
     ) -> ObjectWriteResult:
         if metadata is None:
             metadata = {}
-        data = self.get_object(
-            source.bucket_name, source.object_name, version_id=source.version_id
-        ).data
-        metadata_ = (
-            self.buckets[source.bucket_name]
-            .objects[source.object_name]
-            .get_object(
-                source.version_id,
-                self.get_bucket_versioning(source.bucket_name),
-            )
-            .metadata
+        version = self.__check_bucket(source.bucket_name).get_object(
+            source.object_name, source.version_id
         )
-        if metadata_ is not None:
-            metadata_.update(metadata)
-        else:
-            metadata_ = metadata
+        # The payload is immutable, so the copy can share it rather than
+        # going through an HTTPResponse that reads a fresh copy out
+        data = version.payload
+        # A new dict, the source keeps its own metadata
+        metadata_ = version.metadata | metadata
         return self.put_object(
             bucket_name, object_name, data, len(data), metadata=metadata_
         )
@@ -912,29 +1055,25 @@ class MockMinioClient:
         delete_object_list: Iterable[DeleteObject],
         bypass_governance_mode: bool = False,
     ) -> Iterator[DeleteError]:
-        self.__check_bucket(bucket_name)
-        delete_object_list = itertools.chain(delete_object_list)
-        kwargs = {"strict": False} if sys.version_info.minor != 9 else {}
+        # Resolved once for the whole stream rather than once per batch
+        bucket = self.__check_bucket(bucket_name)
+        delete_object_list = iter(delete_object_list)
         while True:
             # get 1000 entries or whatever available.
-            objects = [
-                delete_object
-                for _, delete_object in zip(
-                    range(1000), delete_object_list, **kwargs
-                )
-            ]
+            objects = list(itertools.islice(delete_object_list, 1000))
 
             if not objects:
                 break
 
-            result = self._delete_objects(
-                bucket_name,
-                objects,
-                quiet=True,
-                bypass_governance_mode=bypass_governance_mode,
+            # Only the errors are kept, and the whole batch is deleted before
+            # they are reported, as the server would
+            errors = list(
+                self._delete_bucket_objects(
+                    bucket, objects, collect_deleted=False
+                )
             )
 
-            for error in result.error_list:
+            for error in errors:
                 # AWS S3 returns "NoSuchVersion" error when
                 # version doesn't exist ignore this error
                 # yield all errors otherwise
@@ -948,61 +1087,89 @@ class MockMinioClient:
         quiet: bool = False,
         bypass_governance_mode: bool = False,
     ) -> DeleteResult:
-        bucket = self.__check_bucket(bucket_name)
         deleted = []
         errors = []
+        for result in self._delete_bucket_objects(
+            self.__check_bucket(bucket_name), delete_object_list
+        ):
+            if isinstance(result, DeleteError):
+                errors.append(result)
+            else:
+                deleted.append(result)
+        return DeleteResult(deleted, errors)
+
+    def _delete_bucket_objects(
+        self,
+        bucket: MockMinioBucket,
+        delete_object_list: Iterable[DeleteObject],
+        collect_deleted: bool = True,
+    ) -> Iterator[Union[DeletedObject, DeleteError]]:
+        # Yields the outcome of each entry in turn, the successful ones only if
+        # collect_deleted is set
+        objects = bucket.objects
+        # Delete markers only exist once versioning has been turned on
+        versioned = bucket.versioning.status != OFF
         for obj in delete_object_list:
             object_name = obj._name  # noqa: SLF001
             version_id = obj._version_id  # noqa: SLF001
+            the_object = objects.get(object_name)
+            if the_object is None:
+                # Reported without raising, nor even building the error:
+                # bulk deletes naming missing keys are common and raising
+                # costs far more than the lookup
+                yield DeleteError(
+                    code=_NO_SUCH_KEY_CODE,
+                    message=_NO_SUCH_KEY_MESSAGE,
+                    name=object_name,
+                    version_id=version_id,
+                )
+                continue
+            if not versioned and version_id is None:
+                # The common case: the object just goes away, there is no
+                # version to parse nor delete marker to report
+                del objects[object_name]
+                if collect_deleted:
+                    yield DeletedObject(object_name, None, False, None)
+                continue
             try:
-                the_object = bucket._check_object(object_name=object_name)  # noqa: SLF001
                 version_id_ = the_object._check_version_id(  # noqa: SLF001
                     version_id=version_id
                 )
-                bucket.remove_object(
-                    object_name=object_name,
-                    version_id=version_id,
-                )
-            except S3Error as error:
-                errors.append(
-                    DeleteError(
-                        code=error.code,
-                        message=error.message,
-                        name=object_name,
-                        version_id=version_id,
-                    )
-                )
-                break
+                # Reuse the object and the parsed version id rather than
+                # resolving both again
+                bucket._remove_object(the_object, version_id_)  # noqa: SLF001
             except Exception as error:
-                errors.append(
-                    DeleteError(
-                        code=error.__class__.__name__,
-                        message=str(error),
-                        name=object_name,
-                        version_id=version_id,
-                    )
-                )
-                break
-            else:
-                # See boto3's documentation to understand the weird meaning of
-                # delete_marker
-                # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/delete_objects.html
-                delete_marker = False
-                delete_marker_version_id = None
-                if version_id_ is None and (
-                    delete_marker := the_object.get_latest().is_delete_marker
-                ):
-                    delete_marker_version_id = str(the_object.latest_version_id)
-                    version_id = None
-                deleted.append(
-                    DeletedObject(
-                        name=object_name,
-                        version_id=version_id,
-                        delete_marker=delete_marker,
-                        delete_marker_version_id=delete_marker_version_id,
-                    )
+                if isinstance(error, S3Error):
+                    code, message = error.code, error.message
+                else:
+                    code, message = error.__class__.__name__, str(error)
+                yield DeleteError(
+                    code=code,
+                    message=message,
+                    name=object_name,
+                    version_id=version_id,
                 )
-        return DeleteResult(deleted, errors)
+                continue
+            if not collect_deleted:
+                continue
+            # See boto3's documentation to understand the weird meaning of
+            # delete_marker
+            # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/delete_objects.html
+            delete_marker = False
+            delete_marker_version_id = None
+            if (
+                versioned
+                and version_id_ is None
+                and (delete_marker := the_object.get_latest().is_delete_marker)
+            ):
+                delete_marker_version_id = str(the_object.latest_version_id)
+                version_id = None
+            yield DeletedObject(
+                name=object_name,
+                version_id=version_id,
+                delete_marker=delete_marker,
+                delete_marker_version_id=delete_marker_version_id,
+            )
 
     def __check_bucket(self, bucket_name: str) -> MockMinioBucket:
         try:
@@ -1016,8 +1183,19 @@ def minio_mock_servers():
     return MockMinioServers()
 
 
+@pytest.fixture(scope="session")
+def minio_mock_servers_session():
+    servers = MockMinioServers()
+    yield servers
+    servers.reset()
+
+
+def _minio_new(cls, *args, **kwargs):
+    return object.__new__(cls)
+
+
 @pytest.fixture
-def minio_mock(mocker, minio_mock_servers):
+def minio_mock(minio_mock_servers):
     def minio_mock_init(
         cls,
         *args,
@@ -1027,4 +1205,14 @@ def minio_mock(mocker, minio_mock_servers):
         client.connect(minio_mock_servers)
         return client
 
-    return mocker.patch.object(Minio, "__new__", new=minio_mock_init)
+    # unittest.mock pulls asyncio in, only pay for it when the fixture is used
+    from unittest.mock import patch
+
+    try:
+        with patch.object(Minio, "__new__", new=minio_mock_init) as mocked:
+            yield mocked
+    finally:
+        # Unpatching deletes Minio.__new__, after which CPython hands the
+        # constructor arguments to object.__new__ and Minio() raises
+        # "object.__new__() takes exactly one argument"
+        Minio.__new__ = _minio_new
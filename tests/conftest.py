@@ -1,4 +1,17 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
 from pytest_minio_mock import minio_mock
 from pytest_minio_mock import minio_mock_servers
+from pytest_minio_mock import minio_mock_servers_session
+
+pytest_plugins = ["pytester"]
+
+
+@pytest.fixture(scope="session")
+def maya_bytes():
+    # Read once for the whole session rather than by every test
+    return Path("tests/fixtures/maya.jpeg").read_bytes()
@@ -1,6 +1,7 @@
+import io
 import sys
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 import validators
@@ -30,6 +31,7 @@ from pytest_minio_mock.plugin import (
     MockMinioBucket,
     MockMinioClient,
     MockMinioObject,
+    MockMinioServers,
 )
 
 
@@ -91,6 +93,42 @@ class TestsMockMinioClient:
         with pytest.raises(ValueError, match="is not valid"):
             MockMinioClient("[wrong")
 
+    @pytest.mark.parametrize(
+        "endpoint",
+        (
+            "http://local.host:9000",
+            "https://play.min.io",
+            "localhost:9000",
+            "127.0.0.1:9000",
+            "[::1]:9000",
+            "[::ffff:1.2.3.4]:9000",
+        ),
+    )
+    def test_valid_endpoints(self, endpoint):
+        expect(MockMinioClient(endpoint)._base_url).to(equal(endpoint))
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        (
+            "-abc:9000",
+            "abc-:9000",
+            "a..b:9000",
+            "a_b:9000",
+            "999.999.999.999:9000",
+            "http://a..b",
+            "localhost:99999",
+            "localhost:9000/foo/bar",
+            "http://local.host:9000/foo/bar",
+            "ftp://local.host:9000",
+            "http://local.host:9000\n",
+            "[:]:9000",
+            "[1::2::3]:9000",
+        ),
+    )
+    def test_invalid_endpoints(self, endpoint):
+        with pytest.raises(ValueError, match="is not valid"):
+            MockMinioClient(endpoint)
+
 
 def test_make_bucket(minio_mock):
     bucket_name = "test-bucket"
@@ -100,11 +138,12 @@ def test_make_bucket(minio_mock):
     expect(client.bucket_exists(bucket_name)).to(be_true)
 
 
-def test_fget(minio_mock):
+def test_fget(minio_mock, tmp_path):
     bucket_name = "test-bucket"
     object_name = "test-object"
     file_path = "tests/fixtures/maya.jpeg"
-    dl_path = "tests/maya.jpeg"
+    # Download out of the tree, where nothing can pick the file up
+    dl_path = str(tmp_path / "maya.jpeg")
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
@@ -114,16 +153,15 @@ def test_fget(minio_mock):
         expect(f1.read()).to(equal(f2.read()))
 
 
-def test_putting_and_removing_objects_no_versionning(minio_mock):
+def test_putting_and_removing_objects_no_versionning(minio_mock, maya_bytes):
     # simple thing
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
 
     expect(client.buckets[bucket_name].objects).to(have_key(object_name))
     with pytest.raises(ValueError, match="API V1 is not mocked"):
@@ -143,7 +181,7 @@ def test_putting_and_removing_objects_no_versionning(minio_mock):
     with pytest.raises(S3Error, match="does not exist"):
         _ = client.get_object(bucket_name, object_name)
 
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
 
     to_delete = [DeleteObject(object_name, None)]
     multiple_delete_result = client._delete_objects(bucket_name, to_delete)
@@ -159,19 +197,55 @@ def test_putting_and_removing_objects_no_versionning(minio_mock):
         be_none
     )
 
+    multiple_delete_result = client._delete_objects(bucket_name, to_delete)
+    expect(multiple_delete_result.object_list).to(have_len(0))
+    expect(multiple_delete_result.error_list).to(have_len(1))
+    expect(multiple_delete_result.error_list[0].code).to(equal("NoSuchKey"))
+    expect(multiple_delete_result.error_list[0].name).to(equal(object_name))
+    # Same message as when get_object raises for the missing key
+    with pytest.raises(S3Error) as error:
+        client.get_object(bucket_name, object_name)
+    expect(multiple_delete_result.error_list[0].message).to(
+        equal(error.value.message)
+    )
+
+
+def test_deleting_objects_reports_every_error(minio_mock):
+    client = Minio("http://local.host:9000")
+    bucket_name = "test-bucket"
+    client.make_bucket(bucket_name)
+    for object_name in ("a", "c", "e"):
+        client.put_object(bucket_name, object_name, b"data", 4)
+
+    to_delete = [DeleteObject(name) for name in ("a", "b", "c", "d")]
+    multiple_delete_result = client._delete_objects(bucket_name, to_delete)
+    expect([obj.name for obj in multiple_delete_result.object_list]).to(
+        equal(["a", "c"])
+    )
+    expect([error.name for error in multiple_delete_result.error_list]).to(
+        equal(["b", "d"])
+    )
+
+    errors = list(
+        client.remove_objects(
+            bucket_name, [DeleteObject(name) for name in ("b", "e")]
+        )
+    )
+    expect([error.name for error in errors]).to(equal(["b"]))
+    expect(list(client.list_objects(bucket_name))).to(have_len(0))
 
-def test_putting_objects_with_versionning_enabled(minio_mock):
+
+def test_putting_objects_with_versionning_enabled(minio_mock, maya_bytes):
     client = Minio("http://local.host:9000")
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
     client.make_bucket(bucket_name)
     # Versioning Enabled
     client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
     # Add 3 objects
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     # there should be 3 versions of the same object
     expect(
         client.list_objects(bucket_name, object_name, include_version=False)
@@ -184,19 +258,20 @@ def test_putting_objects_with_versionning_enabled(minio_mock):
         client.get_object(bucket_name, object_name, version_id="wrong")
 
 
-def test_removing_object_version_with_versionning_enabled(minio_mock):
+def test_removing_object_version_with_versionning_enabled(
+    minio_mock, maya_bytes
+):
     client = Minio("http://local.host:9000")
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
     client.make_bucket(bucket_name)
 
     # Versioning Enabled
     client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
     # Add 3 objects
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
 
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
@@ -214,9 +289,9 @@ def test_removing_object_version_with_versionning_enabled(minio_mock):
     )
     expect(objects).to(have_len(0))
     # Add 3 objects
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
 
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
@@ -265,7 +340,7 @@ def test_removing_object_version_with_versionning_enabled(minio_mock):
 
     expect(objects[0].version_id).to(equal(versions[0].version_id))
 
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
     )
@@ -282,19 +357,19 @@ def test_removing_object_version_with_versionning_enabled(minio_mock):
 
 def test_putting_and_removing_and_listing_objects_with_versionning_enabled(  # noqa: PLR0915
     minio_mock,
+    maya_bytes,
 ):
     client = Minio("http://local.host:9000")
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
     client.make_bucket(bucket_name)
 
     # Versioning Enabled
     client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
     # Add 3 objects
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
     )
@@ -323,7 +398,7 @@ def test_putting_and_removing_and_listing_objects_with_versionning_enabled(  # n
     expect(versions2).to(equal(versions))
 
     # putting a new version after deletion will add a new version
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     expect(
         list(
             client.list_objects(bucket_name, object_name, include_version=True)
@@ -400,8 +475,8 @@ def test_putting_and_removing_and_listing_objects_with_versionning_enabled(  # n
         expect(obj.delete_marker).to(be_false)
         expect(obj.delete_marker_version_id).to(be_none)
 
-    version_id = client.fput_object(
-        bucket_name, object_name, file_path
+    version_id = client.put_object(
+        bucket_name, object_name, maya_bytes, len(maya_bytes)
     ).version_id
     to_delete = [DeleteObject(object_name)]
 
@@ -416,14 +491,13 @@ def test_putting_and_removing_and_listing_objects_with_versionning_enabled(  # n
     expect(obj.delete_marker_version_id).not_to(equal(version_id))
 
 
-def test_versioned_objects_after_upload(minio_mock):
+def test_versioned_objects_after_upload(minio_mock, maya_bytes):
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
@@ -432,8 +506,8 @@ def test_versioned_objects_after_upload(minio_mock):
     first_version = objects[0].version_id
     expect(first_version).to(be_none)
 
-    client.fput_object(bucket_name, object_name, file_path)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     objects = list(
         client.list_objects(bucket_name, object_name, include_version=True)
     )
@@ -467,6 +541,71 @@ def test_versioned_objects_after_upload(minio_mock):
     expect(objects).to(have_len(1))
 
 
+@pytest.mark.parametrize(
+    "to_version_id",
+    (
+        lambda version_id: version_id.hex,
+        lambda version_id: f"{{{version_id}}}",
+        lambda version_id: version_id.urn,
+    ),
+    ids=("hex", "braces", "urn"),
+)
+def test_version_id_forms(minio_mock, to_version_id):
+    client = Minio("http://local.host:9000")
+    bucket_name = "test-bucket"
+    client.make_bucket(bucket_name)
+    client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
+    version_id = client.put_object(bucket_name, "object", b"data", 4).version_id
+    response = client.get_object(
+        bucket_name, "object", version_id=to_version_id(UUID(version_id))
+    )
+    expect(response.data).to(equal(b"data"))
+
+
+def test_overwritten_null_version_is_newest(minio_mock):
+    bucket_name = "test-bucket"
+    object_name = "test-object"
+
+    client = Minio("http://local.host:9000")
+    client.make_bucket(bucket_name)
+    client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
+    first_version = client.put_object(
+        bucket_name, object_name, b"a", 1
+    ).version_id
+    client.set_bucket_versioning(bucket_name, VersioningConfig(SUSPENDED))
+    client.put_object(bucket_name, object_name, b"b", 1)
+    client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
+    second_version = client.put_object(
+        bucket_name, object_name, b"c", 1
+    ).version_id
+    client.set_bucket_versioning(bucket_name, VersioningConfig(SUSPENDED))
+    client.put_object(bucket_name, object_name, b"d", 1)
+
+    objects = list(
+        client.list_objects(bucket_name, object_name, include_version=True)
+    )
+    expect([obj.version_id for obj in objects]).to(
+        equal([None, second_version, first_version])
+    )
+    expect([obj.is_latest for obj in objects]).to(
+        equal(["true", "false", "false"])
+    )
+
+    client.remove_object(bucket_name, object_name, "null")
+    expect(client.get_object(bucket_name, object_name).data).to(equal(b"c"))
+
+
+def test_errors_are_not_shared(minio_mock):
+    client = Minio("http://local.host:9000")
+    client.make_bucket("test-bucket")
+    with pytest.raises(S3Error) as first:
+        client.stat_object("test-bucket", "missing")
+    with pytest.raises(S3Error) as second:
+        client.stat_object("test-bucket", "missing")
+    expect(first.value is second.value).to(be_false)
+    expect(first.value.code).to(equal(second.value.code))
+
+
 def test_stat_object(minio_mock):
     bucket_name = "test-bucket"
     object_name = "test-object"
@@ -535,6 +674,60 @@ def test_file_download(minio_mock, versioned):
         expect(response.data).to(equal(file_content))
 
 
+def test_get_object_streams(minio_mock):
+    bucket_name = "test-bucket"
+    client = Minio("http://local.host:9000")
+    client.make_bucket(bucket_name)
+    client.put_object(bucket_name, "object", b"Test file content", 17)
+    response = client.get_object(bucket_name, "object")
+    expect(list(response.stream(8))).to(equal([b"Test fil", b"e conten", b"t"]))
+    response = client.get_object(bucket_name, "object")
+    expect(response.read(4)).to(equal(b"Test"))
+    expect(response.read()).to(equal(b" file content"))
+
+
+def test_put_object_keeps_stream_content(minio_mock):
+    bucket_name = "test-bucket"
+    client = Minio("http://local.host:9000")
+    client.make_bucket(bucket_name)
+    buffer = io.BytesIO(b"Test file content")
+    client.put_object(bucket_name, "buffer", buffer, 17)
+    buffer.write(b"Overwritten")
+    expect(client.get_object(bucket_name, "buffer").data).to(
+        equal(b"Test file content")
+    )
+    with Path("tests/fixtures/maya.jpeg").open("rb") as file_data:
+        content = file_data.read()
+        file_data.seek(0)
+        client.put_object(bucket_name, "file", file_data, len(content))
+    expect(client.get_object(bucket_name, "file").data).to(equal(content))
+
+
+@pytest.mark.parametrize(
+    "make_data",
+    (
+        lambda content: content,
+        io.BytesIO,
+        lambda content: io.BufferedReader(io.BytesIO(content)),
+    ),
+    ids=("bytes", "bytesio", "stream"),
+)
+def test_put_object_honours_length(minio_mock, make_data):
+    bucket_name = "test-bucket"
+    client = Minio("http://local.host:9000")
+    client.make_bucket(bucket_name)
+    data = make_data(b"hello world")
+    client.put_object(bucket_name, "short", data, 5)
+    expect(client.get_object(bucket_name, "short").data).to(equal(b"hello"))
+    if not isinstance(data, bytes):
+        # Streams are left past what was stored, like after a read
+        expect(data.tell()).to(equal(5))
+    client.put_object(bucket_name, "full", make_data(b"hello world"), -1)
+    expect(client.get_object(bucket_name, "full").data).to(
+        equal(b"hello world")
+    )
+
+
 def test_bucket_exists(minio_mock):
     bucket_name = "existing-bucket"
     client = Minio("http://local.host:9000")
@@ -558,17 +751,16 @@ def test_bucket_versioning(minio_mock):
 
 
 @pytest.mark.parametrize("versioned", (True, False))
-def test_get_presigned_url(minio_mock, versioned):
+def test_get_presigned_url(minio_mock, maya_bytes, versioned):
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
     version = None
     if versioned:
         client.set_bucket_versioning(bucket_name, VersioningConfig(ENABLED))
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     if versioned:
         version = list(
             client.list_objects(bucket_name, object_name, include_version=True)
@@ -581,26 +773,24 @@ def test_get_presigned_url(minio_mock, versioned):
         expect(url.endswith(f"?versionId={version}")).to(be_true)
 
 
-def test_presigned_put_url(minio_mock):
+def test_presigned_put_url(minio_mock, maya_bytes):
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     url = client.presigned_put_object(bucket_name, object_name)
     expect(validators.url(url)).to(be_true)
 
 
-def test_presigned_get_url(minio_mock):
+def test_presigned_get_url(minio_mock, maya_bytes):
     bucket_name = "test-bucket"
     object_name = "test-object"
-    file_path = "tests/fixtures/maya.jpeg"
 
     client = Minio("http://local.host:9000")
     client.make_bucket(bucket_name)
-    client.fput_object(bucket_name, object_name, file_path)
+    client.put_object(bucket_name, object_name, maya_bytes, len(maya_bytes))
     url = client.presigned_get_object(bucket_name, object_name)
     expect(validators.url(url)).to(be_true)
 
@@ -671,6 +861,88 @@ def test_list_objects(minio_mock):
     expect({obj.object_name for obj in objects_root}).to(
         equal({"a/", "object4"})
     )
+    objects_root = client.list_objects(bucket_name, prefix=None)
+    expect({obj.object_name for obj in objects_root}).to(
+        equal({"a/", "object4"})
+    )
+
+
+def test_list_objects_sorted_with_start_after(minio_mock):
+    client = Minio("http://local.host:9000")
+    bucket_name = "new-bucket"
+    client.make_bucket(bucket_name)
+    for object_name in ("b/2", "a/1", "b/1", "c/1", "b/3"):
+        client.put_object(bucket_name, object_name, data=b"data", length=4)
+
+    objects = client.list_objects(bucket_name, recursive=True)
+    expect([obj.object_name for obj in objects]).to(
+        equal(["a/1", "b/1", "b/2", "b/3", "c/1"])
+    )
+    objects = client.list_objects(
+        bucket_name, prefix="b/", recursive=True, start_after="b/1"
+    )
+    expect([obj.object_name for obj in objects]).to(equal(["b/2", "b/3"]))
+    objects = client.list_objects(
+        bucket_name, prefix="b/", recursive=True, start_after="a/9"
+    )
+    expect([obj.object_name for obj in objects]).to(
+        equal(["b/1", "b/2", "b/3"])
+    )
+    objects = client.list_objects(
+        bucket_name, prefix="b/", recursive=True, start_after="b/3"
+    )
+    expect(list(objects)).to(have_len(0))
+
+
+def test_list_objects_non_recursive_skips_directories(minio_mock):
+    client = Minio("http://local.host:9000")
+    bucket_name = "new-bucket"
+    client.make_bucket(bucket_name)
+    # "-" and "." sort before "/", "0" right after it. Once its slashes are
+    # stripped, "a//" is a file, listed after the "a/" found from "a/-x".
+    for object_name in (
+        "a-b",
+        "a.c",
+        "a/-x",
+        "a//",
+        "a/1",
+        "a/b/2",
+        "a/c",
+        "a0",
+        "b/1",
+        "p/a/-x",
+        "p/a//",
+    ):
+        client.put_object(bucket_name, object_name, data=b"data", length=4)
+
+    objects = client.list_objects(bucket_name)
+    expect([obj.object_name for obj in objects]).to(
+        equal(["a-b", "a.c", "a/", "a//", "a0", "b/", "p/"])
+    )
+    objects = client.list_objects(bucket_name, prefix="a/")
+    expect([obj.object_name for obj in objects]).to(
+        equal(["a/-x", "a//", "a/1", "a/b/", "a/c"])
+    )
+    objects = client.list_objects(bucket_name, prefix="p/")
+    expect([obj.object_name for obj in objects]).to(equal(["p/a/", "p/a//"]))
+
+
+def test_patching_a_client_method(minio_mock, mocker):
+    client = Minio("http://local.host:9000")
+    client.make_bucket("test-bucket")
+    mocker.patch.object(client, "get_object", side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        client.get_object("test-bucket", "test-object")
+
+
+def test_patching_a_bucket_method(minio_mock, mocker):
+    client = Minio("http://local.host:9000")
+    client.make_bucket("test-bucket")
+    mocker.patch.object(
+        client.buckets["test-bucket"], "put_object", side_effect=RuntimeError
+    )
+    with pytest.raises(RuntimeError):
+        client.put_object("test-bucket", "test-object", b"data", 4)
 
 
 def test_connecting_to_the_same_endpoint(minio_mock):
@@ -684,6 +956,40 @@ def test_connecting_to_the_same_endpoint(minio_mock):
     expect(client_2_buckets).to(equal(client_1_buckets))
 
 
+def test_session_servers(pytester, mocker):
+    # The override from the README, the second test must see the bucket made
+    # by the first one
+    pytester.makeconftest(
+        """
+        import pytest
+        from pytest_minio_mock import minio_mock, minio_mock_servers_session
+
+        @pytest.fixture()
+        def minio_mock_servers(minio_mock_servers_session):
+            return minio_mock_servers_session
+        """
+    )
+    pytester.makepyfile(
+        """
+        from minio import Minio
+
+        servers = []
+
+        def test_make_bucket(minio_mock, minio_mock_servers):
+            servers.append(minio_mock_servers)
+            Minio("http://local.host:9000").make_bucket("shared")
+
+        def test_bucket_is_shared(minio_mock, minio_mock_servers):
+            assert minio_mock_servers is servers[0]
+            assert Minio("http://local.host:9000").bucket_exists("shared")
+        """
+    )
+    reset = mocker.spy(MockMinioServers, "reset")
+    result = pytester.runpytest_inprocess("-p", "no:xdist", "-p", "no:sugar")
+    result.assert_outcomes(passed=2)
+    expect(reset.call_count).to(equal(1))
+
+
 def test_compose(minio_mock):
     client = Minio("http://local.host:9000")
     bucket_name = "new-bucket"
@@ -726,3 +1032,31 @@ def test_copy(minio_mock):
     expect(client.stat_object(bucket_name, "test2.txt").metadata).to(
         equal({"a": "C"})
     )
+    expect(client.stat_object(bucket_name, "test.txt").metadata).to(
+        equal({"a": "A"})
+    )
+
+
+def test_minio_usable_without_fixture(pytester):
+    # Run in a session of its own so that a test using minio_mock is sure to
+    # run first, whatever the order or the worker this test gets
+    pytester.makeconftest(
+        "from pytest_minio_mock import minio_mock, minio_mock_servers"
+    )
+    pytester.makepyfile(
+        """
+        from minio import Minio
+        from pytest_minio_mock.plugin import MockMinioClient
+
+        def test_mocked(minio_mock):
+            assert isinstance(Minio("localhost:9000"), MockMinioClient)
+
+        def test_not_mocked():
+            client = Minio("localhost:9000")
+            assert type(client) is Minio
+        """
+    )
+    result = pytester.runpytest_inprocess("-p", "no:xdist", "-p", "no:sugar")
+    result.assert_outcomes(passed=2)
+    client = Minio("localhost:9000")
+    expect(client).not_to(be_a(MockMinioClient))